@@ -510,20 +510,19 @@ def advance_scene(data):
     # Clean up Pyodide game state BEFORE scene transition
     # This prevents false 'partner_disconnected' when WebRTC closes during transition
     if PYODIDE_COORDINATOR is not None:
-        for game_id, game_state in list(PYODIDE_COORDINATOR.games.items()):
-            for player_id, socket_id in list(game_state.players.items()):
-                if socket_id == flask.request.sid:
-                    logger.info(
-                        f"[AdvanceScene] Removing {subject_id} (player {player_id}) "
-                        f"from Pyodide game {game_id} before scene transition"
-                    )
-                    PYODIDE_COORDINATOR.remove_player(
-                        game_id=game_id,
-                        player_id=player_id,
-                        notify_others=True,
-                        reason='scene_completed',
-                    )
-                    break
+        entry = PYODIDE_COORDINATOR.find_player_by_socket(flask.request.sid)
+        if entry is not None:
+            game_id, player_id = entry
+            logger.info(
+                f"[AdvanceScene] Removing {subject_id} (player {player_id}) "
+                f"from Pyodide game {game_id} before scene transition"
+            )
+            PYODIDE_COORDINATOR.remove_player(
+                game_id=game_id,
+                player_id=player_id,
+                notify_others=True,
+                reason='scene_completed',
+            )
 
     participant_stager.advance(socketio, room=flask.request.sid)
 
@@ -848,8 +847,6 @@ def send_pressed_keys(data):
     current_scene = participant_stager.current_scene
     game_manager = GAME_MANAGERS.get(current_scene.scene_id, None)
 
-    client_reported_server_session_id = data.get("server_session_id")
-
     pressed_keys = data["pressed_keys"]
 
     game_manager.process_pressed_keys(
@@ -2494,10 +2491,9 @@ def on_p2p_state_sync(data):
         logger.warning(f"P2P state sync for non-existent game {game_id}")
         return
 
-    # Relay to all other players in the game
-    for player_id, socket_id in game.players.items():
-        if player_id != sender_id:
-            socketio.emit('p2p_state_sync', data, room=socket_id)
+    # Relay to all other players in the game with a single room emit
+    # (players join the game_id room at match time), skipping the sender
+    socketio.emit('p2p_state_sync', data, room=game_id, skip_sid=flask.request.sid)
 
     logger.debug(
         f"Relayed P2P state sync from player {sender_id} in game {game_id} "
@@ -2740,85 +2736,86 @@ def on_disconnect():
 
     # Handle Pyodide multiplayer games
     if PYODIDE_COORDINATOR is not None:
-        # Iterate through all games to find this player
-        for game_id, game_state in list(PYODIDE_COORDINATOR.games.items()):
-            for player_id, socket_id in game_state.players.items():
-                if socket_id == flask.request.sid:
-                    # For Pyodide games, check if the game is active
-                    is_in_active_pyodide_game = game_state.is_active
+        # Find this player via the coordinator's socket index
+        entry = PYODIDE_COORDINATOR.find_player_by_socket(flask.request.sid)
+        game_state = PYODIDE_COORDINATOR.games.get(entry[0]) if entry else None
+        if game_state is not None:
+            game_id, player_id = entry
+            # For Pyodide games, check if the game is active
+            is_in_active_pyodide_game = game_state.is_active
 
-                    logger.info(
-                        f"Player {player_id} (subject {subject_id}) disconnected "
-                        f"from Pyodide game {game_id} (active={is_in_active_pyodide_game})"
-                    )
+            logger.info(
+                f"Player {player_id} (subject {subject_id}) disconnected "
+                f"from Pyodide game {game_id} (active={is_in_active_pyodide_game})"
+            )
 
-                    # Record session termination for admin dashboard
-                    if ADMIN_AGGREGATOR and is_in_active_pyodide_game:
-                        # Build session snapshot with P2P health data
-                        all_subject_ids = list(game_state.player_subjects.values())
-                        p2p_health = ADMIN_AGGREGATOR._get_p2p_health_for_game(game_id)
-
-                        session_snapshot = {
-                            'game_id': game_id,
-                            'subject_ids': all_subject_ids,
-                            'p2p_health': p2p_health,
-                            'frame_number': game_state.frame_number,
-                            'created_at': game_state.created_at,
-                        }
-
-                        ADMIN_AGGREGATOR.record_session_termination(
-                            game_id=game_id,
-                            reason='partner_disconnected',
-                            players=all_subject_ids,
-                            details={
-                                'disconnected_player': subject_id,
-                                'disconnected_player_id': player_id,
-                                'frame_at_disconnect': game_state.frame_number,
-                            },
-                            session_snapshot=session_snapshot
-                        )
-
-                    # Only notify others if player was in an active game
-                    PYODIDE_COORDINATOR.remove_player(
-                        game_id=game_id,
-                        player_id=player_id,
-                        notify_others=is_in_active_pyodide_game
-                    )
+            # Record session termination for admin dashboard
+            if ADMIN_AGGREGATOR and is_in_active_pyodide_game:
+                # Build session snapshot with P2P health data
+                all_subject_ids = list(game_state.player_subjects.values())
+                p2p_health = ADMIN_AGGREGATOR._get_p2p_health_for_game(game_id)
+
+                session_snapshot = {
+                    'game_id': game_id,
+                    'subject_ids': all_subject_ids,
+                    'p2p_health': p2p_health,
+                    'frame_number': game_state.frame_number,
+                    'created_at': game_state.created_at,
+                }
+
+                ADMIN_AGGREGATOR.record_session_termination(
+                    game_id=game_id,
+                    reason='partner_disconnected',
+                    players=all_subject_ids,
+                    details={
+                        'disconnected_player': subject_id,
+                        'disconnected_player_id': player_id,
+                        'frame_at_disconnect': game_state.frame_number,
+                    },
+                    session_snapshot=session_snapshot
+                )
 
-                    # CRITICAL: Also clean up GameManager state
-                    # The player may be in GameManager's waitroom (subject_games, waiting_games)
-                    # even though they're also registered in PYODIDE_COORDINATOR
+            # Only notify others if player was in an active game
+            PYODIDE_COORDINATOR.remove_player(
+                game_id=game_id,
+                player_id=player_id,
+                notify_others=is_in_active_pyodide_game
+            )
+
+            # CRITICAL: Also clean up GameManager state
+            # The player may be in GameManager's waitroom (subject_games, waiting_games)
+            # even though they're also registered in PYODIDE_COORDINATOR
+            logger.info(
+                f"[Disconnect:Pyodide] Checking GameManager cleanup for {subject_id}. "
+                f"current_scene={current_scene.scene_id if current_scene else None}"
+            )
+            game_manager = GAME_MANAGERS.get(current_scene.scene_id, None) if current_scene else None
+            if game_manager:
+                in_game = game_manager.subject_in_game(subject_id)
+                logger.info(
+                    f"[Disconnect:Pyodide] game_manager found, subject_in_game={in_game}, "
+                    f"subject_games={list(game_manager.subject_games.keys())}, "
+                    f"waiting_games={game_manager.waiting_games}"
+                )
+                if in_game:
                     logger.info(
-                        f"[Disconnect:Pyodide] Checking GameManager cleanup for {subject_id}. "
-                        f"current_scene={current_scene.scene_id if current_scene else None}"
+                        f"[Disconnect:Pyodide] Calling remove_subject_quietly for {subject_id}"
                     )
-                    game_manager = GAME_MANAGERS.get(current_scene.scene_id, None) if current_scene else None
-                    if game_manager:
-                        in_game = game_manager.subject_in_game(subject_id)
-                        logger.info(
-                            f"[Disconnect:Pyodide] game_manager found, subject_in_game={in_game}, "
-                            f"subject_games={list(game_manager.subject_games.keys())}, "
-                            f"waiting_games={game_manager.waiting_games}"
-                        )
-                        if in_game:
-                            logger.info(
-                                f"[Disconnect:Pyodide] Calling remove_subject_quietly for {subject_id}"
-                            )
-                            game_manager.remove_subject_quietly(subject_id)
-                            logger.info(
-                                f"[Disconnect:Pyodide] After cleanup: "
-                                f"subject_games={list(game_manager.subject_games.keys())}, "
-                                f"waiting_games={game_manager.waiting_games}"
-                            )
-                    else:
-                        logger.warning(
-                            f"[Disconnect:Pyodide] No game_manager found for scene {current_scene.scene_id if current_scene else 'None'}"
-                        )
-
-                    # Clean up group manager
-                    if GROUP_MANAGER:
-                        GROUP_MANAGER.cleanup_subject(subject_id)
-                    return
+                    game_manager.remove_subject_quietly(subject_id)
+                    logger.info(
+                        f"[Disconnect:Pyodide] After cleanup: "
+                        f"subject_games={list(game_manager.subject_games.keys())}, "
+                        f"waiting_games={game_manager.waiting_games}"
+                    )
+            else:
+                logger.warning(
+                    f"[Disconnect:Pyodide] No game_manager found for scene {current_scene.scene_id if current_scene else 'None'}"
+                )
+
+            # Clean up group manager
+            if GROUP_MANAGER:
+                GROUP_MANAGER.cleanup_subject(subject_id)
+            return
 
     # Handle regular (non-Pyodide) games via GameManager
     # First try the current scene's game manager
@@ -4,6 +4,7 @@ import itertools
 import logging
 import random
 import time
+import traceback
 import uuid
 from typing import Any
 
@@ -1339,7 +1340,6 @@ class GameManager:
         try:
             self._run_server_game_inner(game)
         except Exception as e:
-            import traceback
             error_msg = traceback.format_exc()
             logger.exception(
                 f"Server game loop crashed for {game.game_id}"
@@ -1396,11 +1396,18 @@ class GameManager:
                     self.scene.callback.on_game_tick_end(game)
 
             # Log first few ticks and status changes
-            if game.tick_num <= 3 or game.tick_num % 50 == 0 or game.status in end_status:
+            if logger.isEnabledFor(logging.INFO) and (
+                game.tick_num <= 3
+                or game.tick_num % 50 == 0
+                or game.status in end_status
+            ):
                 logger.info(
-                    f"[ServerLoop:{game.game_id}] tick={game.tick_num}, "
-                    f"status={game.status}, episode={game.episode_num}, "
-                    f"elapsed={time.monotonic() - _t0:.2f}s"
+                    "[ServerLoop:%s] tick=%s, status=%s, episode=%s, elapsed=%.2fs",
+                    game.game_id,
+                    game.tick_num,
+                    game.status,
+                    game.episode_num,
+                    time.monotonic() - _t0,
                 )
 
             self.render_server_game(game)
@@ -1416,6 +1423,9 @@ class GameManager:
                 # Pause between episodes (matches P2P multiplayer flow)
                 eventlet.sleep(self.scene.reset_freeze_s)
 
+                # Fresh event for this reset; must exist before clients can ack
+                game.set_reset_event()
+
                 self.socketio.emit(
                     "game_reset",
                     {
@@ -1434,7 +1444,6 @@ class GameManager:
                     self.reset_events[game.game_id][
                         player_id
                     ] = eventlet.event.Event()
-                game.set_reset_event()
 
                 with game.lock:
                     game.reset()
@@ -1486,7 +1495,9 @@ class GameManager:
 
         subject_reset_event.send()
 
-        if all(e.ready() for e in game_resets.values()):
+        if game.reset_event is not None and all(
+            e.ready() for e in game_resets.values()
+        ):
             game.reset_event.send()
 
     def process_pressed_keys(
@@ -1499,11 +1510,7 @@ class GameManager:
         if game is None:
             return
 
-        subject_agent_id = None
-        for agent_id, sid in game.human_players.items():
-            if subject_id == sid:
-                subject_agent_id = agent_id
-                break
+        subject_agent_id = game.get_subject_agent_id(subject_id)
 
         if subject_agent_id is None:
             logger.error(
@@ -1520,20 +1527,15 @@ class GameManager:
             else:
                 pressed_keys = self.generate_composite_action(pressed_keys)
 
-        if game is None:
-            return
-
-        if not any([k in self.scene.action_mapping for k in pressed_keys]):
+        # First mapped key wins; unmapped keys are ignored.
+        action_mapping = self.scene.action_mapping
+        action = next(
+            (action_mapping[k] for k in pressed_keys if k in action_mapping),
+            None,
+        )
+        if action is None:
             return
 
-        action = None
-        for k in pressed_keys:
-            if k in self.scene.action_mapping:
-                action = self.scene.action_mapping[k]
-                break
-
-        assert action is not None
-
         game.enqueue_action(subject_agent_id, action)
 
     def generate_composite_action(self, pressed_keys) -> list[tuple[str]]:
@@ -1590,8 +1592,10 @@ class GameManager:
                 "render_state": render_state,
                 "step": game.tick_num,
                 "episode": game.episode_num,
-                "rewards": dict(game.episode_rewards),
-                "cumulative_rewards": dict(game.total_rewards),
+                # Emit encodes the payload immediately, so the live
+                # counters can be passed without copying
+                "rewards": game.episode_rewards,
+                "cumulative_rewards": game.total_rewards,
                 "hud_text": hud_text,
             },
             room=game.game_id,
@@ -10,16 +10,18 @@ Coordinates client-side Pyodide games by:
 
 from __future__ import annotations
 
+import collections
 import dataclasses
 import logging
 import random
-import threading
 import time
 from typing import Any, Dict
 
 import eventlet
 import flask_socketio
 
+from mug.server.remote_game import SessionState
+
 logger = logging.getLogger(__name__)
 # Add console handler to see pyodide_game_coordinator logs
 if not logger.handlers:
@@ -28,8 +30,15 @@ if not logger.handlers:
     logger.addHandler(_handler)
     logger.setLevel(logging.INFO)
 
+# Number of inter-action delays kept per player for lag diagnostics
+ACTION_DELAY_HISTORY = 50
+
+# Upper bound on how long a relayed action waits in the buffer, whatever
+# the scene's fps (also used when scene metadata has no fps)
+MAX_RELAY_FLUSH_INTERVAL_S = 1 / 30
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class PyodideGameState:
     """State for a single Pyodide multiplayer game."""
 
@@ -43,11 +52,25 @@ class PyodideGameState:
     action_timeout_seconds: float
     created_at: float
 
+    # Guards the per-game relay/diagnostics fields below, so action traffic
+    # in one game doesn't contend with registry changes in another
+    lock: eventlet.semaphore.Semaphore = dataclasses.field(
+        default_factory=eventlet.semaphore.Semaphore, repr=False, compare=False
+    )
+
     # Diagnostics for lag tracking
     last_action_times: dict[str | int, float] = dataclasses.field(default_factory=dict)
-    action_delays: dict[str | int, list] = dataclasses.field(default_factory=dict)
+    action_delays: dict[str | int, collections.deque] = dataclasses.field(default_factory=dict)
     last_diagnostics_log: float = 0.0
 
+    # Outbound action relay buffer: player_id -> actions awaiting flush
+    pending_relay: dict[str | int, list] = dataclasses.field(default_factory=dict)
+    # Held across drain + emit so flushes from the loop, a full buffer and
+    # game deletion go out in order
+    relay_emit_lock: eventlet.semaphore.Semaphore = dataclasses.field(
+        default_factory=eventlet.semaphore.Semaphore, repr=False, compare=False
+    )
+
     # WebRTC TURN configuration
     turn_username: str | None = None
     turn_credential: str | None = None
@@ -60,6 +83,8 @@ class PyodideGameState:
 
     # Scene metadata for client configuration
     scene_metadata: dict = dataclasses.field(default_factory=dict)
+    # pyodide_game_ready payload, built once at start and replayed on rejoin
+    ready_payload: dict | None = None
     validation_start_time: float | None = None
 
     # Mid-game reconnection state (Phase 20)
@@ -89,12 +114,18 @@ class PyodideGameCoordinator:
     def __init__(self, socketio: flask_socketio.SocketIO, game_manager_getter: callable = None):
         self.socketio = socketio
         self.games: dict[str, PyodideGameState] = {}
-        self.lock = threading.Lock()
+        # Reverse index for disconnect handling: socket_id -> (game_id, player_id)
+        self.socket_index: dict[str, tuple[str, str | int]] = {}
+        # Greenlet-aware: a contended threading.Lock would block the eventlet hub.
+        # Guards the games/socket_index registry; per-game hot-path state
+        # (action relay, diagnostics) is guarded by PyodideGameState.lock.
+        self.lock = eventlet.semaphore.Semaphore()
         self.get_game_manager = game_manager_getter  # Returns GameManager for a game_id
 
         # Configuration
         self.action_timeout = 5.0  # Seconds to wait for actions
         self.max_games = 1000  # Prevent memory exhaustion
+        self.max_relay_batch = 16  # Flush a sender's relay buffer at this size
 
         # Statistics
         self.total_games_created = 0
@@ -126,38 +157,39 @@ class PyodideGameCoordinator:
         Raises:
             ValueError: If max games exceeded
         """
+        # Generate seed and build state outside the lock; only the registry
+        # check and insert need to be serialized.
+        rng_seed = random.randint(0, 2**32 - 1)
+
+        game_state = PyodideGameState(
+            game_id=game_id,
+            players={},
+            player_subjects={},  # player_id -> subject_id mapping
+            frame_number=0,
+            is_active=False,
+            rng_seed=rng_seed,
+            num_expected_players=num_players,
+            action_timeout_seconds=self.action_timeout,
+            created_at=time.time(),
+            turn_username=turn_username,
+            turn_credential=turn_credential,
+            force_turn_relay=force_turn_relay,
+            scene_metadata=scene_metadata or {},
+        )
+
         with self.lock:
             if len(self.games) >= self.max_games:
                 raise ValueError(f"Maximum games ({self.max_games}) exceeded")
 
-            # Generate seed using Python's random (server-side)
-            rng_seed = random.randint(0, 2**32 - 1)
-
-            game_state = PyodideGameState(
-                game_id=game_id,
-                players={},
-                player_subjects={},  # player_id -> subject_id mapping
-                frame_number=0,
-                is_active=False,
-                rng_seed=rng_seed,
-                num_expected_players=num_players,
-                action_timeout_seconds=self.action_timeout,
-                created_at=time.time(),
-                turn_username=turn_username,
-                turn_credential=turn_credential,
-                force_turn_relay=force_turn_relay,
-                scene_metadata=scene_metadata or {},
-            )
-
             self.games[game_id] = game_state
             self.total_games_created += 1
 
-            logger.info(
-                f"Created Pyodide game {game_id} for {num_players} players "
-                f"with seed {rng_seed}"
-            )
+        logger.info(
+            f"Created Pyodide game {game_id} for {num_players} players "
+            f"with seed {rng_seed}"
+        )
 
-            return game_state
+        return game_state
 
     def add_player(
         self,
@@ -180,6 +212,7 @@ class PyodideGameCoordinator:
         # Collect emit data while holding lock, emit outside to avoid deadlock
         emit_assigned_data = None
         start_game_data = None
+        replay_ready_payload = None
 
         with self.lock:
             if game_id not in self.games:
@@ -187,7 +220,18 @@ class PyodideGameCoordinator:
                 return
 
             game = self.games[game_id]
+            previous_socket = game.players.get(player_id)
+            if previous_socket is not None and previous_socket != socket_id:
+                self._unindex_socket(previous_socket, game_id)
+                # The stale socket may still be connected; stop room relays to it
+                self.socketio.server.leave_room(previous_socket, game_id, namespace='/')
             game.players[player_id] = socket_id
+
+            # Actions are relayed to the game_id room, so make sure this
+            # socket is in it (GameManager normally joins it at match time)
+            if socket_id:
+                self.socket_index[socket_id] = (game_id, player_id)
+                self.socketio.server.enter_room(socket_id, game_id, namespace='/')
             if subject_id is not None:
                 game.player_subjects[player_id] = subject_id
 
@@ -209,7 +253,11 @@ class PyodideGameCoordinator:
 
             # Check if game is ready to start
             if len(game.players) == game.num_expected_players:
-                start_game_data = self._prepare_start_game(game_id)
+                if game.ready_payload is None:
+                    start_game_data = self._prepare_start_game(game_id)
+                else:
+                    # Rejoin after start: only the new socket needs the ready event
+                    replay_ready_payload = game.ready_payload
 
         # Emit OUTSIDE the lock to avoid eventlet deadlock
         if emit_assigned_data:
@@ -219,6 +267,8 @@ class PyodideGameCoordinator:
 
         if start_game_data:
             self._execute_start_game(start_game_data)
+        elif replay_ready_payload is not None:
+            self.socketio.emit('pyodide_game_ready', replay_ready_payload, room=socket_id)
 
     def _prepare_start_game(self, game_id: str) -> dict:
         """Prepare game start data while holding lock. Returns data for later emit.
@@ -234,29 +284,31 @@ class PyodideGameCoordinator:
             if gm:
                 remote_game = gm.games.get(game_id)
                 if remote_game:
-                    from mug.server.remote_game import SessionState
                     remote_game.transition_to(SessionState.PLAYING)
 
         logger.info(
             f"Emitting pyodide_game_ready to room {game_id} with players {list(game.players.keys())}"
         )
 
+        # Cache on the game so a rejoining player gets the same payload
+        game.ready_payload = {
+            'game_id': game_id,
+            'players': list(game.players.keys()),
+            'player_subjects': dict(game.player_subjects),  # Copy to avoid concurrent modification
+            # Include TURN config only if credentials are provided
+            'turn_config': {
+                'username': game.turn_username,
+                'credential': game.turn_credential,
+                'force_relay': game.force_turn_relay,
+            } if game.turn_username else None,
+            # Include scene metadata for client configuration
+            'scene_metadata': dict(game.scene_metadata) if game.scene_metadata else {},
+        }
+
         # Return data for emit outside lock
         return {
             'game_id': game_id,
-            'emit_payload': {
-                'game_id': game_id,
-                'players': list(game.players.keys()),
-                'player_subjects': dict(game.player_subjects),  # Copy to avoid concurrent modification
-                # Include TURN config only if credentials are provided
-                'turn_config': {
-                    'username': game.turn_username,
-                    'credential': game.turn_credential,
-                    'force_relay': game.force_turn_relay,
-                } if game.turn_username else None,
-                # Include scene metadata for client configuration
-                'scene_metadata': dict(game.scene_metadata) if game.scene_metadata else {},
-            },
+            'emit_payload': game.ready_payload,
             'num_players': len(game.players),
         }
 
@@ -267,6 +319,9 @@ class PyodideGameCoordinator:
         # Emit game ready event
         self.socketio.emit('pyodide_game_ready', start_data['emit_payload'], room=game_id)
 
+        # One long-lived flusher per game drains the action relay buffer
+        self.socketio.start_background_task(self._relay_flush_loop, game_id)
+
         logger.info(
             f"Game {game_id} started with {start_data['num_players']} players"
         )
@@ -280,10 +335,12 @@ class PyodideGameCoordinator:
         client_timestamp: float | None = None,
     ):
         """
-        Receive action from a player and broadcast to others immediately.
+        Receive action from a player and relay it to the others.
 
         Action Queue approach: No waiting for all players. Each action is
-        immediately relayed to other clients who queue it for their next step.
+        relayed to other clients who queue it for their next step. Relays are
+        buffered and flushed once per frame by _relay_flush_loop, so actions
+        from one player within a frame go out as a single emit.
 
         Args:
             game_id: Game identifier
@@ -292,32 +349,40 @@ class PyodideGameCoordinator:
             frame_number: Frame number (for logging/debugging)
             client_timestamp: Client-side timestamp when action was sent (for lag tracking)
         """
-        with self.lock:
-            if game_id not in self.games:
-                logger.warning(f"Action received for non-existent game {game_id}")
-                return
-
-            game = self.games[game_id]
-
-            if not game.is_active:
-                logger.warning(f"Action received for inactive game {game_id}")
-                return
-
+        # Look the game up without the registry lock (dict reads are atomic
+        # under the GIL); everything below touches only this game's state
+        # and runs under its per-game lock.
+        game = self.games.get(game_id)
+        if game is None:
+            logger.warning(f"Action received for non-existent game {game_id}")
+            return
+        if not game.is_active:
+            logger.warning(f"Action received for inactive game {game_id}")
+            return
+
+        with game.lock:
             # Track timing for diagnostics
             now = time.time()
-            player_id_str = str(player_id)
 
             # Calculate inter-action delay for this player
-            if player_id_str in game.last_action_times:
-                delay = now - game.last_action_times[player_id_str]
-                if player_id_str not in game.action_delays:
-                    game.action_delays[player_id_str] = []
-                game.action_delays[player_id_str].append(delay)
-                # Keep only last 50 measurements
-                if len(game.action_delays[player_id_str]) > 50:
-                    game.action_delays[player_id_str].pop(0)
-
-            game.last_action_times[player_id_str] = now
+            last_action_time = game.last_action_times.get(player_id)
+            if last_action_time is not None:
+                delays = game.action_delays.get(player_id)
+                if delays is None:
+                    # Ring buffer: keep only the last N measurements
+                    delays = game.action_delays[player_id] = collections.deque(
+                        maxlen=ACTION_DELAY_HISTORY
+                    )
+                delays.append(now - last_action_time)
+                game.last_action_times[player_id] = now
+            elif player_id in game.players:
+                game.last_action_times[player_id] = now
+            else:
+                # Only players in the game are tracked; a stray id is ignored
+                logger.debug(
+                    "Game %s: Not tracking action timing for unexpected player %s",
+                    game_id, player_id,
+                )
 
             # Log diagnostics periodically (every 5 seconds)
             if now - game.last_diagnostics_log > 5.0:
@@ -326,24 +391,93 @@ class PyodideGameCoordinator:
 
             # Log frame info for debugging
             logger.debug(
-                f"Game {game_id}: Received action {action} from player {player_id} "
-                f"at frame {frame_number}"
+                "Game %s: Received action %s from player %s at frame %s",
+                game_id, action, player_id, frame_number,
             )
 
-            # Broadcast to ALL OTHER players immediately (Action Queue approach)
-            for other_player_id, socket_id in game.players.items():
-                if other_player_id != player_id:
-                    self.socketio.emit('pyodide_other_player_action', {
-                        'player_id': player_id,
-                        'action': action,
-                        'frame_number': frame_number,
-                        'timestamp': time.time()
-                    }, room=socket_id)
+            # Queue for relay; actions arriving before the flush runs (e.g. a
+            # burst after a lag spike) go out together in one emit.
+            buffered = game.pending_relay.setdefault(player_id, [])
+            buffered.append({
+                'player_id': player_id,
+                'action': action,
+                'frame_number': frame_number,
+                'timestamp': now
+            })
+            flush_now = len(buffered) >= self.max_relay_batch
+
+        # Flush OUTSIDE the lock to avoid eventlet deadlock
+        if flush_now:
+            self._flush_action_relay(game_id)
+
+    def _relay_flush_loop(self, game_id: str):
+        """
+        Flush a game's relay buffer once per frame until the game is removed.
 
-            logger.debug(
-                f"Game {game_id}: Relayed action from player {player_id} "
-                f"to {len(game.players) - 1} other player(s)"
-            )
+        The interval is capped at MAX_RELAY_FLUSH_INTERVAL_S so low-fps
+        scenes don't add a full frame of input latency.
+
+        Started once per game from _execute_start_game.
+
+        Args:
+            game_id: Game identifier
+        """
+        game = self.games.get(game_id)
+        if game is None:
+            return
+
+        interval = MAX_RELAY_FLUSH_INTERVAL_S
+        fps = game.scene_metadata.get('fps')
+        if fps:
+            interval = min(1.0 / fps, interval)
+        while self.games.get(game_id) is game:
+            eventlet.sleep(interval)
+            if game.pending_relay:
+                self._flush_action_relay(game_id)
+
+    def _flush_action_relay(self, game_id: str):
+        """
+        Relay buffered actions to the other players in a game.
+
+        Each sender's actions go out as one room emit (skipping the sender's
+        socket): a lone action uses 'pyodide_other_player_action', several
+        use 'pyodide_other_player_actions_batch'.
+
+        Args:
+            game_id: Game identifier
+        """
+        game = self.games.get(game_id)
+        if game is None:
+            return
+
+        # The emit lock spans drain and emit so concurrent flushes can't
+        # reorder batches; game.lock is only held for the swap.
+        with game.relay_emit_lock:
+            with game.lock:
+                pending = game.pending_relay
+                game.pending_relay = {}
+                outbound = [
+                    (player_id, actions, game.players.get(player_id))
+                    for player_id, actions in pending.items()
+                ]
+                num_recipients = len(game.players) - 1
+
+            for player_id, actions, sender_socket in outbound:
+                # Broadcast to ALL OTHER players (Action Queue approach).
+                # One room emit so socket.io encodes the payload once; the
+                # sender is excluded via skip_sid.
+                if len(actions) == 1:
+                    self.socketio.emit('pyodide_other_player_action', actions[0],
+                                       room=game_id, skip_sid=sender_socket)
+                else:
+                    self.socketio.emit('pyodide_other_player_actions_batch',
+                                       {'actions': actions},
+                                       room=game_id, skip_sid=sender_socket)
+
+                logger.debug(
+                    "Game %s: Relayed %d action(s) from player %s to %d other player(s)",
+                    game_id, len(actions), player_id, num_recipients,
+                )
 
     def remove_player(self, game_id: str, player_id: str | int, notify_others: bool = True, reason: str = 'partner_disconnected'):
         """
@@ -358,59 +492,101 @@ class PyodideGameCoordinator:
             notify_others: Whether to notify remaining players (default True)
         """
         # Collect data while holding lock, then emit outside lock to avoid deadlock
-        sockets_to_notify = []
         should_notify = False
 
         with self.lock:
-            if game_id not in self.games:
-                return
-
-            game = self.games[game_id]
-
-            if player_id not in game.players:
+            game = self.games.get(game_id)
+            if game is None or player_id not in game.players:
                 return
 
-            # Get remaining player sockets before removing the disconnected player
-            remaining_player_sockets = [
-                socket_id for pid, socket_id in game.players.items()
-                if pid != player_id
-            ]
+            socket_id = game.players.pop(player_id)
+            self._unindex_socket(socket_id, game_id)
+            num_remaining = len(game.players)
 
-            del game.players[player_id]
+            # Drop the player's lag diagnostics so they don't outlive them
+            with game.lock:
+                game.last_action_times.pop(player_id, None)
+                game.action_delays.pop(player_id, None)
 
             logger.info(f"Player {player_id} disconnected from game {game_id}")
 
             # Determine if we should notify (collect data, don't emit yet)
-            if notify_others and len(remaining_player_sockets) > 0:
+            if notify_others and num_remaining > 0:
                 should_notify = True
-                sockets_to_notify = remaining_player_sockets[:]  # Copy list
                 logger.info(
-                    f"Notifying {len(remaining_player_sockets)} remaining players "
+                    f"Notifying {num_remaining} remaining players "
                     f"about disconnection in game {game_id}"
                 )
 
             # If no players left, remove game
-            if len(game.players) == 0:
-                del self.games[game_id]
+            if num_remaining == 0:
+                self._delete_game(game_id)
                 logger.info(f"Removed empty game {game_id}")
             # If there are remaining players, also remove the game since we ended it
             elif notify_others:
-                del self.games[game_id]
+                self._delete_game(game_id)
                 logger.info(f"Removed game {game_id} after player disconnection")
 
         # Emit OUTSIDE the lock to avoid eventlet deadlock
         if should_notify:
-            for socket_id in sockets_to_notify:
-                # Emit p2p_game_ended so client handles with proper overlay and completion code
-                self.socketio.emit(
-                    'p2p_game_ended',
-                    {
-                        'game_id': game_id,
-                        'reason': reason,
-                        'disconnected_player_id': player_id
-                    },
-                    room=socket_id
-                )
+            # Emit p2p_game_ended so client handles with proper overlay and completion code.
+            # The game room holds exactly the game's sockets, so one room emit
+            # (skipping the leaving player) reaches everyone remaining.
+            self.socketio.emit(
+                'p2p_game_ended',
+                {
+                    'game_id': game_id,
+                    'reason': reason,
+                    'disconnected_player_id': player_id
+                },
+                room=game_id,
+                skip_sid=socket_id,
+            )
+
+    def find_player_by_socket(self, socket_id: str) -> tuple[str, str | int] | None:
+        """Look up the (game_id, player_id) a socket is playing as, if any."""
+        return self.socket_index.get(socket_id)
+
+    def remove_by_socket(self, socket_id: str, notify_others: bool = True, reason: str = 'partner_disconnected'):
+        """
+        Remove whichever player is connected on socket_id.
+
+        Thin wrapper over find_player_by_socket + remove_player for callers
+        that only know the socket.
+
+        Args:
+            socket_id: Disconnecting player's socket connection ID
+            notify_others: Whether to notify remaining players (default True)
+            reason: Reason forwarded to remaining players
+        """
+        entry = self.find_player_by_socket(socket_id)
+        if entry is None:
+            return
+        game_id, player_id = entry
+        self.remove_player(game_id, player_id, notify_others=notify_others, reason=reason)
+
+    def _unindex_socket(self, socket_id: str, game_id: str):
+        """Drop socket_id from the reverse index if it still points at game_id.
+
+        Must be called while holding self.lock.
+        """
+        entry = self.socket_index.get(socket_id)
+        if entry is not None and entry[0] == game_id:
+            del self.socket_index[socket_id]
+
+    def _delete_game(self, game_id: str):
+        """Remove a game and its sockets from the registry.
+
+        Buffered relays are flushed first so no in-flight action is dropped.
+        The flush only takes the per-game locks (registry -> game order) and
+        doesn't re-enter the coordinator, so it is safe under self.lock.
+
+        Must be called while holding self.lock.
+        """
+        self._flush_action_relay(game_id)
+        game = self.games.pop(game_id)
+        for socket_id in game.players.values():
+            self._unindex_socket(socket_id, game_id)
 
     def _log_game_diagnostics(self, game: PyodideGameState):
         """
@@ -420,24 +596,27 @@ class PyodideGameCoordinator:
         - Inter-action delay per player (time between actions from same player)
         - Frame number disparity between server runner and clients
         """
-        diagnostics = []
+        # Skip the per-player scans entirely when nothing would be logged
+        if not logger.isEnabledFor(logging.WARNING):
+            return
 
         # Calculate average inter-action delay per player
-        for player_id, delays in game.action_delays.items():
-            if delays:
-                avg_delay = sum(delays) / len(delays)
-                max_delay = max(delays)
-                min_delay = min(delays)
-                diagnostics.append(
-                    f"Player {player_id}: avg={avg_delay*1000:.1f}ms, "
-                    f"max={max_delay*1000:.1f}ms, min={min_delay*1000:.1f}ms"
-                )
+        if logger.isEnabledFor(logging.INFO):
+            diagnostics = []
+            for player_id, delays in game.action_delays.items():
+                if delays:
+                    avg_delay = sum(delays) / len(delays)
+                    max_delay = max(delays)
+                    min_delay = min(delays)
+                    diagnostics.append(
+                        f"Player {player_id}: avg={avg_delay*1000:.1f}ms, "
+                        f"max={max_delay*1000:.1f}ms, min={min_delay*1000:.1f}ms"
+                    )
 
-        if diagnostics:
-            logger.info(
-                f"[Diagnostics] Game {game.game_id} - " +
-                " | ".join(diagnostics)
-            )
+            if diagnostics:
+                logger.info(
+                    "[Diagnostics] Game %s - %s", game.game_id, " | ".join(diagnostics)
+                )
 
         # Warn if there's significant disparity in action rates
         if len(game.action_delays) >= 2:
@@ -450,10 +629,10 @@ class PyodideGameCoordinator:
                 max_avg = max(avg_delays.values())
                 if min_avg > 0 and max_avg / min_avg > 1.5:
                     logger.warning(
-                        f"[Diagnostics] Game {game.game_id}: Action rate disparity detected! "
-                        f"Fastest player: {min_avg*1000:.1f}ms avg, "
-                        f"Slowest player: {max_avg*1000:.1f}ms avg. "
-                        f"This may cause queue buildup and lag."
+                        "[Diagnostics] Game %s: Action rate disparity detected! "
+                        "Fastest player: %.1fms avg, Slowest player: %.1fms avg. "
+                        "This may cause queue buildup and lag.",
+                        game.game_id, min_avg * 1000, max_avg * 1000,
                     )
 
     def handle_webrtc_signal(
@@ -499,12 +678,9 @@ class PyodideGameCoordinator:
                     )
                     return
 
-            # Find sender's player ID by reverse lookup
-            sender_player_id = None
-            for player_id, socket_id in game.players.items():
-                if socket_id == sender_socket_id:
-                    sender_player_id = player_id
-                    break
+            # Find sender's player ID via the socket index
+            entry = self.socket_index.get(sender_socket_id)
+            sender_player_id = entry[1] if entry and entry[0] == game_id else None
 
             if sender_player_id is None:
                 logger.warning(
@@ -512,22 +688,22 @@ class PyodideGameCoordinator:
                 )
                 return
 
-            # Relay the signal to target peer
-            self.socketio.emit(
-                'webrtc_signal',
-                {
-                    'type': signal_type,
-                    'from_player_id': sender_player_id,
-                    'game_id': game_id,
-                    'payload': payload,
-                },
-                room=target_socket,
-            )
+        # Relay the signal to target peer (outside the lock)
+        self.socketio.emit(
+            'webrtc_signal',
+            {
+                'type': signal_type,
+                'from_player_id': sender_player_id,
+                'game_id': game_id,
+                'payload': payload,
+            },
+            room=target_socket,
+        )
 
-            logger.debug(
-                f"Relayed WebRTC {signal_type} from player {sender_player_id} "
-                f"to player {target_player_id} in game {game_id}"
-            )
+        logger.debug(
+            f"Relayed WebRTC {signal_type} from player {sender_player_id} "
+            f"to player {target_player_id} in game {game_id}"
+        )
 
     def handle_player_exclusion(
         self,
@@ -567,40 +743,38 @@ class PyodideGameCoordinator:
                 if pid != excluded_player_id
             ]
 
+        # Emit OUTSIDE the lock to avoid eventlet deadlock.
+        # Payloads are identical for every partner, so build them once.
+        excluded_payload = {
+            'message': 'Your partner experienced a technical issue. The game has ended.',
+            'frame_number': frame_number,
+            'reason': 'partner_exclusion'
+        }
+        export_payload = {
+            'is_partial': True,
+            'termination_reason': 'partner_exclusion',
+            'termination_frame': frame_number
+        }
+        for socket_id in partner_sockets:
             # Notify partner(s) with clear, non-alarming message
-            for socket_id in partner_sockets:
-                self.socketio.emit(
-                    'partner_excluded',
-                    {
-                        'message': 'Your partner experienced a technical issue. The game has ended.',
-                        'frame_number': frame_number,
-                        'reason': 'partner_exclusion'
-                    },
-                    room=socket_id
-                )
+            self.socketio.emit('partner_excluded', excluded_payload, room=socket_id)
 
-                # Trigger data export for partner before cleanup
-                self.socketio.emit(
-                    'trigger_data_export',
-                    {
-                        'is_partial': True,
-                        'termination_reason': 'partner_exclusion',
-                        'termination_frame': frame_number
-                    },
-                    room=socket_id
-                )
+            # Trigger data export for partner before cleanup
+            self.socketio.emit('trigger_data_export', export_payload, room=socket_id)
 
-            logger.info(
-                f"Notified {len(partner_sockets)} partner(s) of exclusion "
-                f"in game {game_id}"
-            )
+        logger.info(
+            f"Notified {len(partner_sockets)} partner(s) of exclusion "
+            f"in game {game_id}"
+        )
 
-            # Brief delay to ensure messages are delivered
-            eventlet.sleep(0.1)
+        # Brief delay to ensure messages are delivered
+        eventlet.sleep(0.1)
 
-            # Now clean up the game
-            del self.games[game_id]
-            logger.info(f"Cleaned up game {game_id} after player exclusion")
+        # Now clean up the game (may already be gone if a disconnect raced us)
+        with self.lock:
+            if game_id in self.games:
+                self._delete_game(game_id)
+        logger.info(f"Cleaned up game {game_id} after player exclusion")
 
     def start_validation(self, game_id: str) -> bool:
         """Mark validation phase started for a game (Phase 19)."""
@@ -618,7 +792,6 @@ class PyodideGameCoordinator:
                 if gm:
                     remote_game = gm.games.get(game_id)
                     if remote_game:
-                        from mug.server.remote_game import SessionState
                         remote_game.transition_to(SessionState.VALIDATING)
 
             logger.info(f"P2P validation started for game {game_id}")
@@ -675,7 +848,7 @@ class PyodideGameCoordinator:
         """Remove a game from the coordinator (Phase 19)."""
         with self.lock:
             if game_id in self.games:
-                del self.games[game_id]
+                self._delete_game(game_id)
                 logger.info(f"Removed game {game_id} from coordinator")
 
     def get_stats(self) -> dict:
@@ -715,11 +888,12 @@ class PyodideGameCoordinator:
             # Track which player disconnected (Phase 23 - DATA-04)
             # The player who reports the loss DETECTED it, so the OTHER player disconnected
             if game.disconnected_player_id is None:
-                for pid in game.players:
-                    if str(pid) != str(player_id):
-                        game.disconnected_player_id = pid
-                        logger.info(f"Disconnected player identified: {pid}")
-                        break
+                # First peer in join order that isn't the reporter
+                reporter = str(player_id)
+                pid = next((p for p in game.players if str(p) != reporter), None)
+                if pid is not None:
+                    game.disconnected_player_id = pid
+                    logger.info(f"Disconnected player identified: {pid}")
 
             if not game.reconnection_in_progress:
                 game.reconnection_in_progress = True
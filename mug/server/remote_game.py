@@ -3,13 +3,14 @@ from __future__ import annotations
 import collections
 import dataclasses
 import logging
-import threading
+import random
 import typing
 import uuid
 from enum import Enum, auto
 from typing import Any
 
 import eventlet
+from gymnasium import spaces
 
 from mug.configurations import configuration_constants
 
@@ -65,8 +66,20 @@ class _AvailableSlot:
 AvailableSlot = _AvailableSlot
 
 
+def _all_flags_set(flags: dict | bool) -> bool:
+    """True if a terminated/truncated value (per-agent dict or scalar) is set for everyone."""
+    if isinstance(flags, dict):
+        return all(flags.values())
+    return bool(flags)
+
+
 class GameCallback:
-    """Base callback interface for game lifecycle hooks."""
+    """Base callback interface for game lifecycle hooks.
+
+    ServerGame declares __slots__, so hooks that need per-game state should
+    keep it in ``remote_game.callback_state`` (a plain dict) rather than
+    setting new attributes on the game.
+    """
 
     def __init__(self, **kwargs) -> None:
         pass
@@ -164,6 +177,39 @@ class ServerGame:
     Phase 93 rebuilds the server game loop on this foundation.
     """
 
+    # One instance per matched game, read every step: slots keep instances
+    # small and attribute loads cheap. New attributes must be listed here;
+    # GameCallback hooks keep their per-game state in callback_state.
+    __slots__ = (
+        "callback_state",
+        "scene",
+        "status",
+        "session_state",
+        "lock",
+        "reset_event",
+        "document_focus_status",
+        "current_ping",
+        "human_players",
+        "bot_players",
+        "_available_slots",
+        "_subject_to_slot",
+        "_game_uuid",
+        "game_id",
+        "episode_num",
+        "episode_rewards",
+        "total_rewards",
+        "total_positive_rewards",
+        "total_negative_rewards",
+        "prev_rewards",
+        "prev_actions",
+        "env",
+        "observation",
+        "policies",
+        "_random_samplers",
+        "pending_actions",
+        "tick_num",
+    )
+
     def __init__(
         self,
         scene: typing.Any,
@@ -173,9 +219,11 @@ class ServerGame:
         self.scene = scene
         self.status = GameStatus.Inactive
         self.session_state = SessionState.WAITING
-        self.lock = threading.Lock()
+        # Greenlet-aware: a contended threading.Lock would block the eventlet hub
+        self.lock = eventlet.semaphore.Semaphore()
+        # Only server-authoritative games wait on this between episodes, so
+        # it is created on demand by set_reset_event() rather than per game.
         self.reset_event: eventlet.event.Event | None = None
-        self.set_reset_event()
 
         self.document_focus_status: dict[str | int, bool] = (
             collections.defaultdict(lambda: True)
@@ -197,24 +245,32 @@ class ServerGame:
                 else:
                     self.bot_players[agent_id] = policy_type
 
-        self.game_uuid: str = str(uuid.uuid4())
+        # Slot bookkeeping kept in sync by add_player / remove_human_player so
+        # capacity checks don't scan human_players. _available_slots is a dict
+        # used as an insertion-ordered set (fresh games list slots in
+        # policy_mapping order).
+        self._available_slots: dict[str | int, None] = dict.fromkeys(
+            self.human_players
+        )
+        self._subject_to_slot: dict[str | int, str | int] = {}
+
+        # Generated on first access; callers normally pass a game_id
+        self._game_uuid: str | None = None
         self.game_id: int | str = (
             game_id if game_id is not None else self.game_uuid
         )
-        assert (
-            game_id is not None
-        ), f"Must pass valid game id! Got {game_id} but expected an int."
 
         self.episode_num: int = 0
-        self.episode_rewards = collections.defaultdict(lambda: 0)
-        self.total_rewards = collections.defaultdict(
-            lambda: 0
+        # Reward counters are keyed by the scene's agent IDs, which are fixed
+        # for the game, so they are preallocated rather than defaultdicts.
+        agent_ids = list(getattr(scene, 'policy_mapping', None) or ())
+        self.episode_rewards: dict[str | int, float] = dict.fromkeys(agent_ids, 0)
+        self.total_rewards: dict[str | int, float] = dict.fromkeys(agent_ids, 0)
+        self.total_positive_rewards: dict[str | int, float] = dict.fromkeys(
+            agent_ids, 0
         )
-        self.total_positive_rewards = collections.defaultdict(
-            lambda: 0
-        )
-        self.total_negative_rewards = collections.defaultdict(
-            lambda: 0
+        self.total_negative_rewards: dict[str | int, float] = dict.fromkeys(
+            agent_ids, 0
         )
         self.prev_rewards: dict[str | int, float] = {}
         self.prev_actions: dict[str | int, str | int] = {}
@@ -223,20 +279,33 @@ class ServerGame:
         self.env = None
         self.observation = None
         self.policies: dict[str, Any] = {}
+        # Random agents: bound action-space samplers, re-derived on reset()
+        self._random_samplers: dict[str | int, typing.Callable[[], Any]] = {}
         self.pending_actions: dict[str | int, Any] = {}
         self.tick_num: int = 0
 
+        # Free-form per-game state for GameCallback hooks (see GameCallback)
+        self.callback_state: dict[str, Any] = {}
+
+    @property
+    def game_uuid(self) -> str:
+        """Random identifier for this game, generated on first access."""
+        if self._game_uuid is None:
+            self._game_uuid = str(uuid.uuid4())
+        return self._game_uuid
+
     def set_reset_event(self) -> None:
         """Reinitialize the reset event."""
         self.reset_event = eventlet.event.Event()
 
-    # Valid session state transitions (SESS-01)
+    # Valid session state transitions (SESS-01). Every SessionState has an
+    # entry, so lookups index directly.
     VALID_TRANSITIONS = {
-        SessionState.WAITING: {SessionState.MATCHED, SessionState.ENDED},
-        SessionState.MATCHED: {SessionState.VALIDATING, SessionState.PLAYING, SessionState.ENDED},
-        SessionState.VALIDATING: {SessionState.PLAYING, SessionState.WAITING, SessionState.ENDED},
-        SessionState.PLAYING: {SessionState.ENDED},
-        SessionState.ENDED: set(),  # Terminal state
+        SessionState.WAITING: frozenset({SessionState.MATCHED, SessionState.ENDED}),
+        SessionState.MATCHED: frozenset({SessionState.VALIDATING, SessionState.PLAYING, SessionState.ENDED}),
+        SessionState.VALIDATING: frozenset({SessionState.PLAYING, SessionState.WAITING, SessionState.ENDED}),
+        SessionState.PLAYING: frozenset({SessionState.ENDED}),
+        SessionState.ENDED: frozenset(),  # Terminal state
     }
 
     def transition_to(self, new_state: SessionState) -> bool:
@@ -248,11 +317,12 @@ class ServerGame:
         Returns:
             True if transition successful, False if invalid
         """
-        if new_state not in self.VALID_TRANSITIONS.get(self.session_state, set()):
+        valid_next_states = self.VALID_TRANSITIONS[self.session_state]
+        if new_state not in valid_next_states:
             logger.error(
                 f"Invalid session transition: {self.session_state} -> {new_state}. "
                 f"Valid transitions from {self.session_state}: "
-                f"{self.VALID_TRANSITIONS.get(self.session_state, set())}"
+                f"{set(valid_next_states)}"
             )
             return False
 
@@ -263,24 +333,14 @@ class ServerGame:
 
     def get_available_human_agent_ids(self) -> list[str]:
         """List the available human player IDs"""
-        return [
-            agent_id
-            for agent_id, subject_id in self.human_players.items()
-            if subject_id is AvailableSlot
-        ]
+        return list(self._available_slots)
 
     def is_at_player_capacity(self) -> bool:
         """Check if there are any available human player IDs."""
-        return not self.get_available_human_agent_ids()
+        return not self._available_slots
 
     def cur_num_human_players(self) -> int:
-        return len(
-            [
-                agent_id
-                for agent_id, subject_id in self.human_players.items()
-                if subject_id != AvailableSlot
-            ]
-        )
+        return len(self.human_players) - len(self._available_slots)
 
     def remove_human_player(self, subject_id) -> None:
         """Remove a human player from the game.
@@ -291,11 +351,7 @@ class ServerGame:
         Note: human_players is keyed by player_id (slot), with subject_id as value.
         We need to find the player_id that maps to this subject_id.
         """
-        player_id_to_remove = None
-        for player_id, sid in self.human_players.items():
-            if sid == subject_id:
-                player_id_to_remove = player_id
-                break
+        player_id_to_remove = self._subject_to_slot.pop(subject_id, None)
 
         if player_id_to_remove is None:
             logger.warning(
@@ -304,12 +360,17 @@ class ServerGame:
             return
 
         self.human_players[player_id_to_remove] = AvailableSlot
+        self._available_slots[player_id_to_remove] = None
         logger.debug(f"Removed {subject_id} from slot {player_id_to_remove}")
 
         if subject_id in self.document_focus_status:
             del self.document_focus_status[subject_id]
             del self.current_ping[subject_id]
 
+    def get_subject_agent_id(self, subject_id) -> str | int | None:
+        """Return the agent slot a subject is playing as, or None."""
+        return self._subject_to_slot.get(subject_id)
+
     def is_ready_to_start(self) -> bool:
         ready = self.is_at_player_capacity()
         return ready
@@ -320,16 +381,17 @@ class ServerGame:
         Returns True if the player was successfully added, False if the slot
         was not available (e.g., due to a race condition).
         """
-        available_ids = self.get_available_human_agent_ids()
-        if player_id not in available_ids:
+        if player_id not in self._available_slots:
             logger.error(
                 f"Player slot {player_id} is not available! "
-                f"Available IDs are: {available_ids}. "
+                f"Available IDs are: {self.get_available_human_agent_ids()}. "
                 f"Attempted to add identifier: {identifier}"
             )
             return False
 
         self.human_players[player_id] = identifier
+        del self._available_slots[player_id]
+        self._subject_to_slot[identifier] = player_id
         logger.info(
             f"Successfully added player {identifier} to slot {player_id}. "
             f"Remaining slots: {self.get_available_human_agent_ids()}"
@@ -345,6 +407,8 @@ class ServerGame:
         env_config = dict(self.scene.env_config or {})
         env_config["render_mode"] = "mug"
         self.env = self.scene.env_creator(**env_config)
+        # Samplers are bound to the previous env's action space
+        self._random_samplers = {}
         logger.info(
             f"Game {self.game_id}: environment built via scene.env_creator"
         )
@@ -356,11 +420,15 @@ class ServerGame:
         using scene.load_policy_fn (if provided). Random agents store None.
         """
         self.policies = {}
+        self._random_samplers = {}
         for agent_id, policy_type in self.scene.policy_mapping.items():
             if policy_type == configuration_constants.PolicyTypes.Human:
                 continue
             if policy_type == configuration_constants.PolicyTypes.Random:
                 self.policies[agent_id] = None
+                self._random_samplers[agent_id] = self._make_random_sampler(
+                    agent_id
+                )
             elif self.scene.load_policy_fn is not None:
                 self.policies[agent_id] = self.scene.load_policy_fn(
                     agent_id, policy_type
@@ -375,6 +443,40 @@ class ServerGame:
             f"Game {self.game_id}: loaded policies for {list(self.policies.keys())}"
         )
 
+    def _make_random_sampler(
+        self, agent_id: str | int
+    ) -> typing.Callable[[], Any]:
+        """Resolve how to sample a random action for agent_id.
+
+        Done once per episode (see reset()) so each step is a single
+        bound-method call rather than repeated action-space type checks.
+        """
+        if not hasattr(self.env, "action_space"):
+            default_action = self.scene.default_action
+            return lambda: default_action
+
+        # Sample random action from the env's action space for this agent
+        action_space = self.env.action_space
+        # For multi-agent envs the action space may be a dict
+        if hasattr(action_space, "__getitem__"):
+            try:
+                action_space = action_space[agent_id]
+            except (KeyError, TypeError):
+                pass
+
+        if isinstance(action_space, spaces.Discrete):
+            # Plain randrange avoids Discrete.sample()'s numpy draw per call.
+            # Seeded from the space's RNG (re-derived on every reset()), so
+            # action_space.seed() keeps random agents reproducible; the
+            # sequence is deterministic in the seed but differs from what
+            # action_space.sample() would draw.
+            n, start = int(action_space.n), int(action_space.start)
+            randrange = random.Random(
+                int(action_space.np_random.integers(2**63))
+            ).randrange
+            return lambda: start + randrange(n)
+        return action_space.sample
+
     def _get_bot_action(self, agent_id: str | int) -> Any:
         """Get an action for a bot agent.
 
@@ -383,17 +485,12 @@ class ServerGame:
         """
         policy_type = self.scene.policy_mapping.get(agent_id)
         if policy_type == configuration_constants.PolicyTypes.Random:
-            # Sample random action from the env's action space for this agent
-            if hasattr(self.env, "action_space"):
-                action_space = self.env.action_space
-                # For multi-agent envs the action space may be a dict
-                if hasattr(action_space, "__getitem__"):
-                    try:
-                        return action_space[agent_id].sample()
-                    except (KeyError, TypeError):
-                        return action_space.sample()
-                return action_space.sample()
-            return self.scene.default_action
+            sampler = self._random_samplers.get(agent_id)
+            if sampler is None:
+                sampler = self._random_samplers[agent_id] = (
+                    self._make_random_sampler(agent_id)
+                )
+            return sampler()
 
         policy = self.policies.get(agent_id)
         if policy is not None and self.scene.policy_inference_fn is not None:
@@ -412,12 +509,19 @@ class ServerGame:
         else:
             self.observation = result
 
+        # Re-derive random samplers so a reseeded action space takes effect
+        for agent_id in self._random_samplers:
+            self._random_samplers[agent_id] = self._make_random_sampler(agent_id)
+
         self.episode_num += 1
-        self.episode_rewards = collections.defaultdict(lambda: 0)
+        for agent_id in self.episode_rewards:
+            self.episode_rewards[agent_id] = 0
         self.tick_num = 0
         self.status = GameStatus.Active
+        # prev_actions may be the dict last handed to env.step, so replace it;
+        # pending_actions is only ever held here, so clear it in place.
         self.prev_actions = {}
-        self.pending_actions = {}
+        self.pending_actions.clear()
         logger.info(
             f"Game {self.game_id}: reset for episode {self.episode_num}"
         )
@@ -432,23 +536,30 @@ class ServerGame:
         Returns:
             Tuple of (observations, rewards, terminated, truncated, infos)
         """
+        # Take this tick's actions and hand enqueue_action a fresh dict, so
+        # actions arriving while the env steps carry over to the next tick.
+        pending_actions = self.pending_actions
+        self.pending_actions = {}
+
+        # Resolve the fallback for humans without a pending action once per
+        # step: previous actions for PreviousSubmittedAction, otherwise
+        # (DefaultAction or any other) always the default action.
+        default_action = self.scene.default_action
+        if (
+            self.scene.action_population_method
+            == configuration_constants.ActionSettings.PreviousSubmittedAction
+        ):
+            fallback_actions = self.prev_actions
+        else:
+            fallback_actions = {}
+
         actions = {}
         for agent_id, policy_type in self.scene.policy_mapping.items():
             if policy_type == configuration_constants.PolicyTypes.Human:
                 # Human agent: use pending action or fallback
-                action = self.pending_actions.get(agent_id)
+                action = pending_actions.get(agent_id)
                 if action is None:
-                    pop_method = self.scene.action_population_method
-                    if (
-                        pop_method
-                        == configuration_constants.ActionSettings.PreviousSubmittedAction
-                    ):
-                        action = self.prev_actions.get(
-                            agent_id, self.scene.default_action
-                        )
-                    else:
-                        # DefaultAction or any other
-                        action = self.scene.default_action
+                    action = fallback_actions.get(agent_id, default_action)
                 actions[agent_id] = action
             else:
                 actions[agent_id] = self._get_bot_action(agent_id)
@@ -459,39 +570,38 @@ class ServerGame:
         )
         self.observation = observations
 
-        # Update reward tracking
-        for agent_id in self.scene.policy_mapping:
-            reward = rewards.get(agent_id, 0) if isinstance(rewards, dict) else rewards
-            self.episode_rewards[agent_id] += reward
-            self.total_rewards[agent_id] += reward
+        # Update reward tracking. Per-agent rewards are resolved up front so
+        # the dict/scalar check runs once per step rather than per agent.
+        if isinstance(rewards, dict):
+            self.prev_rewards = rewards
+            agent_rewards = [
+                (aid, rewards.get(aid, 0)) for aid in self.scene.policy_mapping
+            ]
+        else:
+            self.prev_rewards = dict.fromkeys(self.scene.policy_mapping, rewards)
+            agent_rewards = self.prev_rewards.items()
+
+        episode_rewards = self.episode_rewards
+        total_rewards = self.total_rewards
+        for agent_id, reward in agent_rewards:
+            episode_rewards[agent_id] += reward
+            total_rewards[agent_id] += reward
             if reward > 0:
                 self.total_positive_rewards[agent_id] += reward
             elif reward < 0:
                 self.total_negative_rewards[agent_id] += reward
 
         self.prev_actions = actions
-        self.prev_rewards = rewards if isinstance(rewards, dict) else {
-            aid: rewards for aid in self.scene.policy_mapping
-        }
         self.tick_num += 1
-        self.pending_actions = {}
 
-        # Determine episode status
-        if isinstance(terminated, dict):
-            all_terminated = all(terminated.values())
-        else:
-            all_terminated = bool(terminated)
-
-        if isinstance(truncated, dict):
-            all_truncated = all(truncated.values())
-        else:
-            all_truncated = bool(truncated)
-
-        # Enforce scene-level max_steps (mirrors client-side check in P2P mode)
-        if self.tick_num >= self.scene.max_steps:
-            all_truncated = True
-
-        if all_terminated or all_truncated:
+        # Determine episode status. The scene-level max_steps check (mirrors
+        # client-side check in P2P mode) is cheapest, so it goes first and
+        # the env flags are only inspected until one ends the episode.
+        if (
+            self.tick_num >= self.scene.max_steps
+            or _all_flags_set(terminated)
+            or _all_flags_set(truncated)
+        ):
             if self.episode_num < self.scene.num_episodes:
                 self.status = GameStatus.Reset
             else:
@@ -500,7 +610,11 @@ class ServerGame:
         return (observations, rewards, terminated, truncated, infos)
 
     def enqueue_action(self, agent_id: str | int, action: Any) -> None:
-        """Store a player's latest action for the next step."""
+        """Store a player's latest action for the next step.
+
+        Lock-free: a single dict store, and step() swaps the dict out
+        rather than clearing it, so callers need not hold game.lock.
+        """
         self.pending_actions[agent_id] = action
 
     def tear_down(self):
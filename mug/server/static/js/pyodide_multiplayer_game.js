@@ -1370,33 +1370,15 @@ export class MultiplayerPyodideGame extends pyodide_remote_game.RemoteGame {
 
         // Receive other player's action (GGPO: queue for synchronous processing at frame start)
         socket.on('pyodide_other_player_action', (data) => {
-            // Don't queue actions if game is done
-            if (this.state === "done") {
-                return;
-            }
-
-            const { player_id, action, frame_number } = data;
+            this._queueSocketIOInput(data);
+        });
 
-            // Only log late inputs (potential rollback trigger)
-            const frameDiff = this.frameNumber - frame_number;
-            if (frameDiff > 0) {
-                p2pLog.debug(`Late input via SocketIO: player=${player_id}, frame=${frame_number}, late by ${frameDiff}`);
+        // Server flushes relays once per frame; several actions from one
+        // player within a frame arrive as a batch
+        socket.on('pyodide_other_player_actions_batch', (data) => {
+            for (const actionData of data.actions) {
+                this._queueSocketIOInput(actionData);
             }
-
-            // GGPO-style: Queue input for synchronous processing at frame start
-            // This prevents race conditions during rollback replay
-            this.pendingSocketIOInputs.push({
-                playerId: player_id,
-                action: action,
-                frameNumber: frame_number
-            });
-
-            // Track SocketIO input reception for metrics
-            this.p2pMetrics.inputsReceivedViaSocketIO++;
-
-            // Also update lastConfirmedActions immediately so we always have
-            // the latest action for prediction/fallback
-            this.lastConfirmedActions[String(player_id)] = action;
         });
 
         // P2P state hash sync
@@ -1614,6 +1596,40 @@ env.get_state()
         });
     }
 
+    _queueSocketIOInput(data) {
+        /**
+         * Queue another player's action relayed via SocketIO.
+         * Used for both single and batched relays from the server.
+         */
+        // Don't queue actions if game is done
+        if (this.state === "done") {
+            return;
+        }
+
+        const { player_id, action, frame_number } = data;
+
+        // Only log late inputs (potential rollback trigger)
+        const frameDiff = this.frameNumber - frame_number;
+        if (frameDiff > 0) {
+            p2pLog.debug(`Late input via SocketIO: player=${player_id}, frame=${frame_number}, late by ${frameDiff}`);
+        }
+
+        // GGPO-style: Queue input for synchronous processing at frame start
+        // This prevents race conditions during rollback replay
+        this.pendingSocketIOInputs.push({
+            playerId: player_id,
+            action: action,
+            frameNumber: frame_number
+        });
+
+        // Track SocketIO input reception for metrics
+        this.p2pMetrics.inputsReceivedViaSocketIO++;
+
+        // Also update lastConfirmedActions immediately so we always have
+        // the latest action for prediction/fallback
+        this.lastConfirmedActions[String(player_id)] = action;
+    }
+
     async initialize() {
         /**
          * Initialize Pyodide and environment with seeded RNG
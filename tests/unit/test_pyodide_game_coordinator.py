@@ -0,0 +1,374 @@
+"""Unit tests for PyodideGameCoordinator action relay and player bookkeeping.
+
+Tests cover: create_game, add_player, receive_action, remove_player.
+These tests use a mock socketio object -- no running server or browser needed.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mug.server.pyodide_game_coordinator import (
+    ACTION_DELAY_HISTORY,
+    MAX_RELAY_FLUSH_INTERVAL_S,
+    PyodideGameCoordinator,
+)
+
+# ---------------------------------------------------------------------------
+# Mock helpers
+# ---------------------------------------------------------------------------
+
+def _make_coordinator():
+    """Create a coordinator with a mock socketio and no game manager.
+
+    Background tasks (the per-game relay flusher) are recorded but not run;
+    tests flush relays explicitly via _flush_action_relay.
+    """
+    return PyodideGameCoordinator(socketio=MagicMock())
+
+
+def _start_game(coordinator, game_id="game-1", sockets=("sid-0", "sid-1")):
+    """Create a game and add one player per socket so it becomes active."""
+    coordinator.create_game(game_id=game_id, num_players=len(sockets))
+    for player_id, socket_id in enumerate(sockets):
+        coordinator.add_player(
+            game_id, player_id, socket_id, subject_id=f"subject-{player_id}"
+        )
+    coordinator.socketio.emit.reset_mock()
+    return coordinator.games[game_id]
+
+
+def _emits(coordinator, event):
+    """Return (payload, kwargs) for every emit of the given event."""
+    return [
+        (c.args[1], c.kwargs)
+        for c in coordinator.socketio.emit.call_args_list
+        if c.args[0] == event
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestPyodideGameCoordinator:
+    """Unit tests for PyodideGameCoordinator."""
+
+    def test_game_becomes_active_when_full(self):
+        """Game is activated once num_expected_players have joined."""
+        coordinator = _make_coordinator()
+        game = _start_game(coordinator)
+
+        assert game.is_active
+        assert game.players == {0: "sid-0", 1: "sid-1"}
+
+    def test_create_game_respects_max_games(self):
+        """create_game raises once max_games is reached."""
+        coordinator = _make_coordinator()
+        coordinator.max_games = 1
+        coordinator.create_game(game_id="a", num_players=2)
+
+        with pytest.raises(ValueError):
+            coordinator.create_game(game_id="b", num_players=2)
+        assert "b" not in coordinator.games
+
+    def test_players_join_game_room(self):
+        """add_player puts each socket in the game_id room used for relays."""
+        coordinator = _make_coordinator()
+        _start_game(coordinator)
+
+        enter_room = coordinator.socketio.server.enter_room
+        enter_room.assert_any_call("sid-0", "game-1", namespace="/")
+        enter_room.assert_any_call("sid-1", "game-1", namespace="/")
+
+    def test_action_relayed_to_room_skipping_sender(self):
+        """receive_action emits once to the game room, skipping the sender."""
+        coordinator = _make_coordinator()
+        _start_game(coordinator, sockets=("sid-0", "sid-1", "sid-2"))
+
+        coordinator.receive_action("game-1", 0, action=3, frame_number=7)
+        coordinator._flush_action_relay("game-1")
+
+        relayed = _emits(coordinator, "pyodide_other_player_action")
+        assert len(relayed) == 1
+        payload, kwargs = relayed[0]
+        assert kwargs["room"] == "game-1"
+        assert kwargs["skip_sid"] == "sid-0"
+        assert payload["player_id"] == 0
+        assert payload["action"] == 3
+        assert payload["frame_number"] == 7
+
+    def test_action_burst_coalesced_into_batch(self):
+        """Actions arriving before the relay flush go out as one batch emit."""
+        coordinator = _make_coordinator()
+        _start_game(coordinator)
+
+        for frame in range(3):
+            coordinator.receive_action("game-1", 0, action=frame, frame_number=frame)
+        assert _emits(coordinator, "pyodide_other_player_actions_batch") == []
+
+        coordinator._flush_action_relay("game-1")
+
+        batches = _emits(coordinator, "pyodide_other_player_actions_batch")
+        assert len(batches) == 1
+        payload, kwargs = batches[0]
+        assert [a["frame_number"] for a in payload["actions"]] == [0, 1, 2]
+        assert kwargs["room"] == "game-1"
+        assert kwargs["skip_sid"] == "sid-0"
+        assert coordinator.games["game-1"].pending_relay == {}
+
+    def test_relay_buffer_flushes_at_max_batch(self):
+        """A sender's buffer is flushed inline once it reaches max_relay_batch."""
+        coordinator = _make_coordinator()
+        coordinator.max_relay_batch = 2
+        _start_game(coordinator)
+
+        coordinator.receive_action("game-1", 0, action=1, frame_number=1)
+        coordinator.receive_action("game-1", 0, action=2, frame_number=2)
+
+        assert len(_emits(coordinator, "pyodide_other_player_actions_batch")) == 1
+
+    def test_relay_flusher_started_once_per_game(self):
+        """Starting a game launches a single long-lived relay flusher."""
+        coordinator = _make_coordinator()
+        _start_game(coordinator)
+
+        coordinator.socketio.start_background_task.assert_called_once_with(
+            coordinator._relay_flush_loop, "game-1"
+        )
+
+    def test_relay_flush_loop_flushes_per_frame_until_game_removed(self):
+        """The flusher sleeps 1/fps, flushes pending relays, and exits with the game."""
+        coordinator = _make_coordinator()
+        game = _start_game(coordinator)
+        game.scene_metadata["fps"] = 60
+        coordinator.receive_action("game-1", 0, action=1, frame_number=1)
+        coordinator.receive_action("game-1", 0, action=2, frame_number=2)
+
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 2:
+                del coordinator.games["game-1"]
+
+        with patch(
+            "mug.server.pyodide_game_coordinator.eventlet.sleep",
+            side_effect=fake_sleep,
+        ):
+            coordinator._relay_flush_loop("game-1")
+
+        assert sleeps == [1 / 60, 1 / 60]
+        assert len(_emits(coordinator, "pyodide_other_player_actions_batch")) == 1
+
+    def test_relay_flush_interval_capped_for_low_fps(self):
+        """Low-fps scenes still flush relays at least every MAX_RELAY_FLUSH_INTERVAL_S."""
+        coordinator = _make_coordinator()
+        game = _start_game(coordinator)
+        game.scene_metadata["fps"] = 10
+
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            del coordinator.games["game-1"]
+
+        with patch(
+            "mug.server.pyodide_game_coordinator.eventlet.sleep",
+            side_effect=fake_sleep,
+        ):
+            coordinator._relay_flush_loop("game-1")
+
+        assert sleeps == [MAX_RELAY_FLUSH_INTERVAL_S]
+
+    def test_pending_relay_flushed_when_game_deleted(self):
+        """Buffered actions are relayed before the game is removed."""
+        coordinator = _make_coordinator()
+        _start_game(coordinator, sockets=("sid-0", "sid-1", "sid-2"))
+        coordinator.receive_action("game-1", 1, action=4, frame_number=9)
+
+        coordinator.remove_player("game-1", 0)
+
+        relayed = _emits(coordinator, "pyodide_other_player_action")
+        assert [payload["action"] for payload, _ in relayed] == [4]
+        assert "game-1" not in coordinator.games
+
+    def test_relay_emits_hold_per_game_emit_lock(self):
+        """Relay emits happen under the game's emit lock so flushes stay ordered."""
+        coordinator = _make_coordinator()
+        game = _start_game(coordinator)
+        coordinator.receive_action("game-1", 0, action=1, frame_number=0)
+
+        held = []
+        coordinator.socketio.emit.side_effect = (
+            lambda *args, **kwargs: held.append(game.relay_emit_lock.locked())
+        )
+        coordinator._flush_action_relay("game-1")
+
+        assert held == [True]
+
+    def test_action_for_inactive_game_not_relayed(self):
+        """Actions before the game starts are dropped."""
+        coordinator = _make_coordinator()
+        coordinator.create_game(game_id="game-1", num_players=2)
+        coordinator.add_player("game-1", 0, "sid-0")
+
+        coordinator.receive_action("game-1", 0, action=1, frame_number=0)
+
+        assert _emits(coordinator, "pyodide_other_player_action") == []
+
+    def test_action_for_unknown_game_ignored(self):
+        """Actions for games the coordinator doesn't know are ignored."""
+        coordinator = _make_coordinator()
+
+        coordinator.receive_action("missing", 0, action=1, frame_number=0)
+
+        coordinator.socketio.emit.assert_not_called()
+
+    def test_remove_player_notifies_partner_and_removes_game(self):
+        """Removing a player notifies the rest and drops the game."""
+        coordinator = _make_coordinator()
+        _start_game(coordinator)
+
+        coordinator.remove_player("game-1", 0)
+
+        ended = _emits(coordinator, "p2p_game_ended")
+        assert len(ended) == 1
+        payload, kwargs = ended[0]
+        assert kwargs["room"] == "game-1"
+        assert kwargs["skip_sid"] == "sid-0"
+        assert payload["disconnected_player_id"] == 0
+        assert "game-1" not in coordinator.games
+
+    def test_socket_index_tracks_players(self):
+        """Each joined socket maps back to its (game_id, player_id)."""
+        coordinator = _make_coordinator()
+        _start_game(coordinator)
+
+        assert coordinator.find_player_by_socket("sid-0") == ("game-1", 0)
+        assert coordinator.find_player_by_socket("sid-1") == ("game-1", 1)
+        assert coordinator.find_player_by_socket("unknown") is None
+
+    def test_remove_player_clears_socket_index(self):
+        """Removing a player drops the ended game's sockets from the index."""
+        coordinator = _make_coordinator()
+        _start_game(coordinator)
+
+        coordinator.remove_player(*coordinator.find_player_by_socket("sid-0"))
+
+        assert "game-1" not in coordinator.games
+        assert coordinator.socket_index == {}
+        assert len(_emits(coordinator, "p2p_game_ended")) == 1
+
+    def test_player_exclusion_notifies_partner_and_removes_game(self):
+        """Exclusion notifies the partner, triggers export, then drops the game."""
+        coordinator = _make_coordinator()
+        _start_game(coordinator)
+
+        with patch("mug.server.pyodide_game_coordinator.eventlet.sleep"):
+            coordinator.handle_player_exclusion(
+                "game-1", 0, reason="tab_hidden", frame_number=42
+            )
+
+        excluded = _emits(coordinator, "partner_excluded")
+        exports = _emits(coordinator, "trigger_data_export")
+        assert [kwargs["room"] for _, kwargs in excluded] == ["sid-1"]
+        assert [kwargs["room"] for _, kwargs in exports] == ["sid-1"]
+        assert exports[0][0]["termination_frame"] == 42
+        assert "game-1" not in coordinator.games
+
+    def test_action_delays_bounded(self):
+        """Per-player delay history is a ring buffer capped at ACTION_DELAY_HISTORY."""
+        coordinator = _make_coordinator()
+        game = _start_game(coordinator)
+
+        for frame in range(ACTION_DELAY_HISTORY + 10):
+            coordinator.receive_action("game-1", 0, action=0, frame_number=frame)
+
+        delays = next(iter(game.action_delays.values()))
+        assert len(delays) == ACTION_DELAY_HISTORY
+
+    def test_action_relay_does_not_take_registry_lock(self):
+        """Relaying actions only takes the game's own lock, not the coordinator's."""
+        coordinator = _make_coordinator()
+        _start_game(coordinator)
+        coordinator.lock = MagicMock()
+
+        coordinator.receive_action("game-1", 0, action=1, frame_number=0)
+        coordinator._flush_action_relay("game-1")
+
+        coordinator.lock.__enter__.assert_not_called()
+        assert len(_emits(coordinator, "pyodide_other_player_action")) == 1
+
+    def test_remove_by_socket_removes_indexed_player(self):
+        """remove_by_socket resolves the socket and removes that player."""
+        coordinator = _make_coordinator()
+        _start_game(coordinator)
+
+        coordinator.remove_by_socket("sid-0")
+        coordinator.remove_by_socket("unknown")
+
+        assert "game-1" not in coordinator.games
+        assert coordinator.socket_index == {}
+        assert len(_emits(coordinator, "p2p_game_ended")) == 1
+
+    def test_missing_socket_not_indexed(self):
+        """Players added without a socket don't share a None index entry."""
+        coordinator = _make_coordinator()
+        coordinator.create_game(game_id="a", num_players=2)
+        coordinator.create_game(game_id="b", num_players=2)
+
+        coordinator.add_player("a", 0, None)
+        coordinator.add_player("b", 0, None)
+
+        assert coordinator.socket_index == {}
+
+    def test_webrtc_signal_sender_resolved_from_index(self):
+        """The sender's player id comes from the socket index."""
+        coordinator = _make_coordinator()
+        _start_game(coordinator)
+
+        coordinator.handle_webrtc_signal(
+            "game-1", 1, "offer", {"sdp": "x"}, sender_socket_id="sid-0"
+        )
+
+        signals = _emits(coordinator, "webrtc_signal")
+        assert len(signals) == 1
+        payload, kwargs = signals[0]
+        assert payload["from_player_id"] == 0
+        assert kwargs["room"] == "sid-1"
+
+    def test_rejoin_replays_cached_ready_payload(self):
+        """A player rejoining a started game gets the cached ready event, alone."""
+        coordinator = _make_coordinator()
+        game = _start_game(coordinator)
+
+        coordinator.add_player("game-1", 1, "sid-1b")
+
+        ready = _emits(coordinator, "pyodide_game_ready")
+        assert len(ready) == 1
+        payload, kwargs = ready[0]
+        assert payload is game.ready_payload
+        assert kwargs["room"] == "sid-1b"
+        assert coordinator.find_player_by_socket("sid-1b") == ("game-1", 1)
+        assert coordinator.find_player_by_socket("sid-1") is None
+        coordinator.socketio.server.leave_room.assert_called_once_with(
+            "sid-1", "game-1", namespace="/"
+        )
+
+    def test_action_timing_tracks_only_game_players(self):
+        """Diagnostics track only players in the game and drop leavers."""
+        coordinator = _make_coordinator()
+        game = _start_game(coordinator, sockets=("sid-0", "sid-1", "sid-2"))
+
+        # A stray id arriving first must not displace a real player
+        for player_id in (99, 0, 1, 2):
+            coordinator.receive_action("game-1", player_id, action=0, frame_number=0)
+        assert set(game.last_action_times) == {0, 1, 2}
+
+        coordinator.remove_player("game-1", 0, notify_others=False)
+
+        assert 0 not in game.last_action_times
+        assert 0 not in game.action_delays
@@ -10,9 +10,10 @@ import collections
 from unittest.mock import MagicMock, patch
 
 import pytest
+from gymnasium import spaces
 
 from mug.configurations import configuration_constants
-from mug.server.remote_game import GameStatus, ServerGame
+from mug.server.remote_game import GameStatus, ServerGame, SessionState
 
 # ---------------------------------------------------------------------------
 # Mock helpers
@@ -136,6 +137,15 @@ def _make_game(scene=None, game_id=0):
 class TestServerGameLifecycle:
     """Unit tests for ServerGame lifecycle methods."""
 
+    def test_game_id_defaults_to_uuid(self):
+        """Without a game_id the game falls back to its lazily created uuid."""
+        assert _make_game(game_id=7).game_id == 7
+
+        game = _make_game(game_id=None)
+
+        assert game.game_id == game.game_uuid
+        assert isinstance(game.game_uuid, str)
+
     def test_build_env_creates_environment(self):
         """_build_env creates the env from scene.env_creator with render_mode='mug'."""
         game = _make_game()
@@ -151,8 +161,11 @@ class TestServerGameLifecycle:
         """After _build_env, reset() initializes episode state correctly."""
         game = _make_game()
         game._build_env()
+        game.episode_rewards[0] = 5.0
         game.reset()
 
+        assert game.episode_rewards == {0: 0, 1: 0}
+
         assert game.episode_num == 1
         assert game.tick_num == 0
         assert game.status == GameStatus.Active
@@ -191,6 +204,23 @@ class TestServerGameLifecycle:
         assert game.prev_actions[0] == 6
         assert game.prev_actions[1] == 6
 
+    def test_step_previous_submitted_action_fallback(self):
+        """With PreviousSubmittedAction, a missing action repeats the last one."""
+        scene = MockScene(default_action=6)
+        scene.action_population_method = (
+            configuration_constants.ActionSettings.PreviousSubmittedAction
+        )
+        game = _make_game(scene=scene)
+        game._build_env()
+        game.reset()
+
+        game.enqueue_action(0, 2)
+        game.step()
+        game.step()
+
+        assert game.prev_actions[0] == 2
+        assert game.prev_actions[1] == 6
+
     def test_step_episode_done_sets_reset_status(self):
         """When env returns terminated=True, status becomes Reset (if more episodes remain)."""
         scene = MockScene(num_episodes=3, terminate_after=1)
@@ -248,3 +278,141 @@ class TestServerGameLifecycle:
         # Random agent should have None policy
         assert 1 in game.policies
         assert game.policies[1] is None
+
+    def test_player_slot_bookkeeping(self):
+        """add_player / remove_human_player keep slot availability in sync."""
+        game = _make_game()
+        assert game.get_available_human_agent_ids() == [0, 1]
+
+        assert game.add_player(0, "subject-a")
+        assert not game.add_player(0, "subject-b")
+        assert game.get_available_human_agent_ids() == [1]
+        assert game.cur_num_human_players() == 1
+
+        assert game.add_player(1, "subject-b")
+        assert game.is_at_player_capacity()
+
+        assert game.get_subject_agent_id("subject-b") == 1
+
+        game.remove_human_player("subject-a")
+        assert game.get_subject_agent_id("subject-a") is None
+        assert game.get_available_human_agent_ids() == [0]
+        assert game.human_players[0] != "subject-a"
+        assert game.cur_num_human_players() == 1
+
+    def test_callbacks_store_state_in_callback_state(self):
+        """Callbacks keep per-game state in callback_state; the game has no __dict__."""
+        game = _make_game()
+
+        game.callback_state["score"] = 1
+
+        assert game.callback_state == {"score": 1}
+        assert not hasattr(game, "__dict__")
+
+    def test_random_agent_sampler_resolved_once(self):
+        """_load_policies binds a Random agent's sampler; step() calls it."""
+        scene = MockScene(
+            policy_mapping={
+                0: configuration_constants.PolicyTypes.Human,
+                1: configuration_constants.PolicyTypes.Random,
+            }
+        )
+        game = _make_game(scene=scene)
+        game._build_env()
+        game.env.action_space.sample = MagicMock(return_value=4)
+        game._load_policies()
+        game.reset()
+
+        game.step()
+        game.step()
+
+        assert game.prev_actions[1] == 4
+        assert game.env.action_space.sample.call_count == 2
+
+    def test_random_agent_discrete_space_sampled_in_range(self):
+        """Discrete action spaces are sampled within [start, start + n)."""
+        scene = MockScene(
+            policy_mapping={
+                0: configuration_constants.PolicyTypes.Human,
+                1: configuration_constants.PolicyTypes.Random,
+            }
+        )
+        game = _make_game(scene=scene)
+        game._build_env()
+        game.env.action_space = spaces.Dict({
+            0: spaces.Discrete(2),
+            1: spaces.Discrete(3, start=5),
+        })
+        game._load_policies()
+
+        samples = {game._get_bot_action(1) for _ in range(100)}
+
+        assert samples <= {5, 6, 7}
+
+    def test_random_agent_discrete_space_follows_space_seed(self):
+        """Seeding the action space makes Discrete random agents reproducible."""
+        scene = MockScene(
+            policy_mapping={
+                0: configuration_constants.PolicyTypes.Human,
+                1: configuration_constants.PolicyTypes.Random,
+            }
+        )
+
+        def sample_run(seed):
+            game = _make_game(scene=scene)
+            game._build_env()
+            game.env.action_space = spaces.Discrete(10)
+            game.env.action_space.seed(seed)
+            game._load_policies()
+            return [game._get_bot_action(1) for _ in range(20)]
+
+        assert sample_run(7) == sample_run(7)
+        assert sample_run(7) != sample_run(8)
+
+    def test_random_agent_sampler_follows_reseed_on_reset(self):
+        """Reseeding the action space before reset() replays the same actions."""
+        scene = MockScene(
+            policy_mapping={
+                0: configuration_constants.PolicyTypes.Human,
+                1: configuration_constants.PolicyTypes.Random,
+            }
+        )
+        game = _make_game(scene=scene)
+        game._build_env()
+        game.env.action_space = spaces.Discrete(10)
+        game._load_policies()
+
+        episodes = []
+        for _ in range(2):
+            game.env.action_space.seed(3)
+            game.reset()
+            episodes.append([game._get_bot_action(1) for _ in range(20)])
+
+        assert episodes[0] == episodes[1]
+
+    def test_step_scalar_reward_credited_to_every_agent(self):
+        """A scalar env reward is credited to every agent and split by sign."""
+        game = _make_game()
+        game._build_env()
+        game.reset()
+        game.env.step = MagicMock(return_value=({}, -2.0, False, False, {}))
+
+        game.step()
+
+        assert game.prev_rewards == {0: -2.0, 1: -2.0}
+        assert game.episode_rewards == {0: -2.0, 1: -2.0}
+        assert game.total_negative_rewards == {0: -2.0, 1: -2.0}
+        assert game.total_positive_rewards == {0: 0, 1: 0}
+
+    def test_session_transitions(self):
+        """transition_to follows VALID_TRANSITIONS and rejects anything else."""
+        game = _make_game()
+
+        assert not game.transition_to(SessionState.PLAYING)
+        assert game.session_state == SessionState.WAITING
+
+        assert game.transition_to(SessionState.MATCHED)
+        assert game.transition_to(SessionState.PLAYING)
+        assert game.transition_to(SessionState.ENDED)
+        assert not game.transition_to(SessionState.WAITING)
+        assert game.session_state == SessionState.ENDED